@@ -95,6 +95,19 @@ def process_command_line(argv):
              "flag. The first --topology flag is taken to be the "
              "topology to use for the first instance of the "
              "--trajectories flag, and so forth.")
+    input_args.add_argument(
+        '--feature-dtype', default=None, choices=['float32', 'float64'],
+        help="Convert features to this type before clustering. Using "
+             "float32 halves the memory footprint of the features and "
+             "the memory traffic of each distance computation, at the "
+             "cost of precision in the features themselves (distances "
+             "are still accumulated in double precision). By default, "
+             "features keep the type they were saved with.")
+    input_args.add_argument(
+        '--processes', default=auto_nprocs(), type=int,
+        help="Number of processes to use when loading trajectories, "
+             "and of threads to use when assigning features to cluster "
+             "centers.")
 
     # PARAMETERS
     cluster_args = parser.add_argument_group("Clustering Settings")
@@ -209,6 +222,11 @@ def process_command_line(argv):
             raise exception.ImproperlyConfigured(
                 "The number of --topology and --trajectory flags must agree.")
 
+        if args.feature_dtype:
+            raise exception.ImproperlyConfigured(
+                "Option --feature-dtype is only meaningful when clustering "
+                "features.")
+
     else:
         # CANNOT CLUSTER
         raise exception.ImproperlyConfigured(
@@ -262,20 +280,26 @@ def expand_files(pgroups):
     return expanded_pgroups
 
 
-def load_features(features, stride):
+def load_features(features, stride, dtype=None):
     try:
         if len(features) == 1:
             with timed("Loading features took %.1f s.", logger.info):
                 lengths, data = mpi.io.load_h5_as_striped(features[0], stride)
 
+            # astype always copies, so a type conversion (if requested)
+            # is done in the same pass as turning over the array.
+            with timed("Turned over array in %.2f min", logger.info):
+                tmp_data = data.copy() if dtype is None else data.astype(dtype)
+                del data
+                data = tmp_data
+
         else:  # and len(features) > 1
+            # npys are copied out of memory maps into a freshly allocated
+            # array (converting type on the way in), so there is no need
+            # to turn it over, which would double peak memory use.
             with timed("Loading features took %.1f s.", logger.info):
-                lengths, data = mpi.io.load_npy_as_striped(features, stride)
-
-        with timed("Turned over array in %.2f min", logger.info):
-            tmp_data = data.copy()
-            del data
-            data = tmp_data
+                lengths, data = mpi.io.load_npy_as_striped(
+                    features, stride, dtype=dtype)
     except MemoryError:
         logger.error(
             "Ran out of memory trying to allocate features array"
@@ -333,7 +357,7 @@ def load_trajectories(topologies, trajectories, selections, stride, processes):
 
     with timed("Loading took %.1f sec", logger.info):
         lengths, xyz = mpi.io.load_trajectory_as_striped(
-            flat_trjs, args=configs, processes=auto_nprocs())
+            flat_trjs, args=configs, processes=processes)
 
     with timed("Turned over array in %.2f min", logger.info):
         tmp_xyz = xyz.copy()
@@ -375,7 +399,9 @@ def load_trjs_or_features(args):
 
     if args.features:
         with timed("Loading features took %.1f s.", logger.info):
-            lengths, data = load_features(args.features, stride=args.subsample)
+            lengths, data = load_features(
+                args.features, stride=args.subsample,
+                dtype=args.feature_dtype)
     else:
         assert args.trajectories
         assert len(args.trajectories) == len(args.topologies)
@@ -390,7 +416,7 @@ def load_trjs_or_features(args):
         with timed("Loading trajectories took %.1f s.", logger.info):
             lengths, xyz, select_top = load_trajectories(
                 args.topologies, args.trajectories, selections=args.atoms,
-                stride=args.subsample, processes=auto_nprocs())
+                stride=args.subsample, processes=args.processes)
 
         logger.info("Clustering using %s atoms matching '%s'.", xyz.shape[1],
                     args.atoms)
@@ -426,7 +452,7 @@ def write_centers(result, args):
         centers = load_asymm_frames(result.center_indices, args.trajectories,
                                     args.topologies, args.subsample)
         with open(args.center_features, 'wb') as f:
-            pickle.dump(centers, f)
+            pickle.dump(centers, f, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 def write_assignments_and_distances_with_reassign(result, args):
@@ -463,6 +489,7 @@ def main(argv=None):
         n_clusters=args.cluster_number,
         cluster_radius=args.cluster_radius,
         mpi_mode=mpi_mode,
+        n_procs=args.processes,
         **kwargs)
 
     clustering.fit(data)
@@ -14,6 +14,7 @@ from tables.exceptions import NoSuchNodeError
 from enspara import exception
 from enspara.msm import implied_timescales, builders
 from enspara.util import array as ra
+from enspara.util.parallel import auto_nprocs
 
 
 def process_command_line(argv):
@@ -45,6 +46,10 @@ def process_command_line(argv):
     parser.add_argument(
         "--trim", default=False, action="store_true",
         help="Turn ergodic trimming on.")
+    parser.add_argument(
+        "--processes", default=auto_nprocs(), type=int,
+        help="Number of processes to use. Each lag time is computed "
+             "independently, so lag times are split across processes.")
 
     parser.add_argument(
         "--timestep", default=None, type=float,
@@ -141,7 +146,7 @@ def main(argv=None):
     tscales = implied_timescales(
         assignments, args.lag_times, n_times=args.n_eigenvalues,
         sliding_window=True, trim=args.trim,
-        method=args.symmetrization)
+        method=args.symmetrization, n_procs=args.processes)
 
     import matplotlib as mpl
     mpl.use('Agg')
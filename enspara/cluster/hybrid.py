@@ -44,6 +44,9 @@ class KHybrid(BaseEstimator, ClusterMixin, util.MolecularClusterMixin):
         Use the MPI version of the algorithm. This assumes that each node
         in the MPI swarm owns its own data. If None, it is determined
         automatically.
+    n_procs : int, default=None
+        Number of threads to use when assigning feature data to many
+        centers at once. If None, this is determined automatically.
 
     References
     ----------
@@ -54,7 +57,7 @@ class KHybrid(BaseEstimator, ClusterMixin, util.MolecularClusterMixin):
 
     def __init__(self, metric, n_clusters=None, cluster_radius=None,
                  kmedoids_updates=5, random_first_center=False,
-                 random_state=None, mpi_mode=None):
+                 random_state=None, mpi_mode=None, n_procs=None):
 
         if n_clusters is None and cluster_radius is None:
             raise ImproperlyConfigured("Either n_clusters or cluster_radius "
@@ -68,6 +71,7 @@ class KHybrid(BaseEstimator, ClusterMixin, util.MolecularClusterMixin):
         self.metric = util._get_distance_method(metric)
         self.random_state = check_random_state(random_state)
         self.mpi_mode = mpi_mode if mpi_mode is not None else mpi.size() != 1
+        self.n_procs = n_procs
 
     def fit(self, X, init_centers=None):
         """Takes trajectories, X, and performs KHybrid clustering.
@@ -90,7 +94,8 @@ class KHybrid(BaseEstimator, ClusterMixin, util.MolecularClusterMixin):
             random_first_center=self.random_first_center,
             init_centers=init_centers,
             random_state=self.random_state,
-            mpi_mode=self.mpi_mode)
+            mpi_mode=self.mpi_mode,
+            n_procs=self.n_procs)
 
         self.runtime_ = time.perf_counter() - t0
 
@@ -100,14 +105,15 @@ class KHybrid(BaseEstimator, ClusterMixin, util.MolecularClusterMixin):
 def hybrid(
         X, distance_method, n_iters=5, n_clusters=np.inf,
         dist_cutoff=0, random_first_center=False,
-        init_centers=None, random_state=None, mpi_mode=False):
+        init_centers=None, random_state=None, mpi_mode=False,
+        n_procs=None):
 
     distance_method = util._get_distance_method(distance_method)
 
     result = kcenters.kcenters(
         X, distance_method, n_clusters=n_clusters, dist_cutoff=dist_cutoff,
         init_centers=init_centers, random_first_center=random_first_center,
-        mpi_mode=mpi_mode)
+        mpi_mode=mpi_mode, n_procs=n_procs)
 
     cluster_center_inds, assignments, distances, centers = (
         result.center_indices, result.assignments, result.distances,
@@ -118,7 +124,7 @@ def hybrid(
             kmedoids._kmedoids_pam_update(
                 X, distance_method,
                 cluster_center_inds, assignments, distances,
-                random_state=random_state)
+                random_state=random_state, n_procs=n_procs)
 
         logger.info("KMedoids update %s of %s", i, n_iters)
 
@@ -47,6 +47,9 @@ class KCenters(BaseEstimator, ClusterMixin, util.MolecularClusterMixin):
         Use the MPI version of the algorithm. This assumes that each node
         in the MPI swarm owns its own data. If None, it is determined
         automatically.
+    n_procs : int, default=None
+        Number of threads to use when assigning feature data to many
+        centers at once. If None, this is determined automatically.
 
     References
     ----------
@@ -57,7 +60,8 @@ class KCenters(BaseEstimator, ClusterMixin, util.MolecularClusterMixin):
 
     def __init__(
             self, metric, n_clusters=None, cluster_radius=None,
-            random_first_center=False, random_state=None, mpi_mode=None):
+            random_first_center=False, random_state=None, mpi_mode=None,
+            n_procs=None):
 
         if n_clusters is None and cluster_radius is None:
             raise ImproperlyConfigured("Either n_clusters or cluster_radius "
@@ -71,6 +75,7 @@ class KCenters(BaseEstimator, ClusterMixin, util.MolecularClusterMixin):
 
         self.random_state = check_random_state(random_state)
         self.mpi_mode = mpi.size() != 1 if mpi_mode is None else mpi_mode
+        self.n_procs = n_procs
 
     def fit(self, X, init_centers=None):
         """Takes trajectories, X, and performs KCenters clustering.
@@ -94,7 +99,8 @@ class KCenters(BaseEstimator, ClusterMixin, util.MolecularClusterMixin):
             dist_cutoff=self.cluster_radius,
             init_centers=init_centers,
             random_first_center=self.random_first_center,
-            mpi_mode=self.mpi_mode)
+            mpi_mode=self.mpi_mode,
+            n_procs=self.n_procs)
 
         self.runtime_ = time.perf_counter() - t0
         return self
@@ -107,7 +113,7 @@ def kcenters_mpi(*args, **kwargs):
 
 def kcenters(traj, distance_method, n_clusters=np.inf, dist_cutoff=0,
              init_centers=None, random_first_center=False,
-             use_triangle_inequality=False, mpi_mode=False):
+             use_triangle_inequality=False, mpi_mode=False, n_procs=None):
     """Function implementation of the k-centers clustering algorithm.
 
     K-centers is essentially an outlier detection algorithm. It
@@ -154,6 +160,9 @@ def kcenters(traj, distance_method, n_clusters=np.inf, dist_cutoff=0,
         greater than half than its nearest intercluster distance to avoid
         recomputing some distances. This optimization was developed in
         ref [3]_.
+    n_procs : int, default=None
+        Number of threads to use when assigning feature data to
+        `init_centers`. If None, this is determined automatically.
 
     Returns
     -------
@@ -201,7 +210,7 @@ def kcenters(traj, distance_method, n_clusters=np.inf, dist_cutoff=0,
         centers = [c for c in init_centers]
         logger.info("Updating assignments to previous cluster centers")
         assignments, distances = util.assign_to_nearest_center(
-            traj, centers, distance_method)
+            traj, centers, distance_method, n_procs=n_procs)
         ctr_inds = list(
             util.find_cluster_centers(assignments, distances))
 
@@ -302,7 +311,7 @@ def _kcenters_iteration(
     assert len(dist.shape) == len(distances.shape)
 
     inds = (dist < distances)
-    distances[inds] = dist[inds]
+    np.copyto(distances, dist, where=inds)
     assignments[inds] = len(center_inds)
 
     center_inds.append(new_center_index)
@@ -369,7 +378,7 @@ def _kcenters_iteration_mpi(
 
     inds = (new_dists < distances)
 
-    distances[inds] = new_dists[inds]
+    np.copyto(distances, new_dists, where=inds)
     assignments[inds] = len(center_inds)
 
     center_inds.append(
@@ -14,7 +14,7 @@ from . import util
 logger = logging.getLogger(__name__)
 
 
-def kmedoids(X, distance_method, n_clusters, n_iters=5):
+def kmedoids(X, distance_method, n_clusters, n_iters=5, n_procs=None):
     """K-Medoids clustering.
 
     K-Medoids is a clustering algorithm similar to the k-means algorithm
@@ -37,6 +37,9 @@ def kmedoids(X, distance_method, n_clusters, n_iters=5):
         cluster center.
     n_iters : int, default=5
         Number of rounds of new proposed centers to run.
+    n_procs : int, default=None
+        Number of threads to use when assigning feature data to many
+        centers at once. If None, this is determined automatically.
 
     Returns
     -------
@@ -57,13 +60,13 @@ def kmedoids(X, distance_method, n_clusters, n_iters=5):
         cluster_center_inds = np.random.randint(0, n_frames, n_clusters)
 
     assignments, distances = util.assign_to_nearest_center(
-        X, X[cluster_center_inds], distance_method)
+        X, X[cluster_center_inds], distance_method, n_procs=n_procs)
     cluster_center_inds = util.find_cluster_centers(assignments, distances)
 
     for i in range(n_iters):
         cluster_center_inds, distances, assignments, centers = \
             _kmedoids_pam_update(X, distance_method, cluster_center_inds,
-                                 assignments, distances)
+                                 assignments, distances, n_procs=n_procs)
         logger.info("KMedoids update %s", i)
 
     return util.ClusterResult(
@@ -118,7 +121,7 @@ def _propose_new_center_amongst(X, state_inds, mpi_mode, random_state):
 
 def _kmedoids_pam_update(
         X, metric, medoid_inds, assignments, distances, proposals=None,
-        cost=_msq, random_state=None):
+        cost=_msq, random_state=None, n_procs=None):
     """Compute a kmedoids update using Partitioning Around Medoids (PAM)
 
     PAM iteratively proposes a new cluster center from among the points
@@ -154,6 +157,9 @@ def _kmedoids_pam_update(
         minimzed.
     random_state : numpy.RandomState
         RandomState object used to indentify new centers.
+    n_procs : int, default=None
+        Number of threads to use when reassigning feature data to the
+        medoids. If None, this is determined automatically.
 
     Returns
     -------
@@ -262,7 +268,7 @@ def _kmedoids_pam_update(
                    .format(n=np.count_nonzero(dst_up_assig_this)),
                    logger.debug):
             ambig_assigs, ambig_dists = util.assign_to_nearest_center(
-                X[dst_up_assig_this], new_medoids, metric)
+                X[dst_up_assig_this], new_medoids, metric, n_procs=n_procs)
 
         new_assig[dst_up_assig_this] = ambig_assigs
         new_dist[dst_up_assig_this] = ambig_dists
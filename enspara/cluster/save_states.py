@@ -18,10 +18,10 @@ def _save_states(centers_info):
     output_directory = centers_info['output'][0]
     topology = centers_info['topology'][0]
     traj = md.load(traj_filename, top=topology)
-    for num in range(len(states)):
+    for state, conf, frame in zip(states, confs, frames):
         pdb_filename = "{dir}State{state}-{conf}.pdb".format(
-            dir=output_directory, state=states[num], conf=confs[num])
-        center = traj[frames[num]]
+            dir=output_directory, state=state, conf=conf)
+        center = traj[frame]
         center.save_pdb(pdb_filename)
 
 
@@ -9,14 +9,19 @@
 
 import logging
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 import mdtraj as md
 import numpy as np
 
+from scipy.spatial.distance import cdist
+from sklearn.metrics.pairwise import euclidean_distances
+
 from ..geometry.libdist import euclidean, manhattan
 
 from ..exception import ImproperlyConfigured, DataInvalid
 from ..util import partition_list, partition_indices
+from ..util.parallel import auto_nprocs
 from ..util import array as ra
 
 logger = logging.getLogger(__name__)
@@ -25,6 +30,18 @@ msmbuilder_libdistance_metrics = ["euclidean", "sqeuclidean", "cityblock",
                                   "chebyshev", "canberra", "braycurtis",
                                   "hamming", "jaccard"]
 
+# libdist distance functions with an equivalent scipy cdist metric. For
+# these, distances to many centers can be computed in a single call.
+_CDIST_METRICS = {euclidean: 'euclidean', manhattan: 'cityblock'}
+
+# maximum number of elements in each (n_frames, n_centers) block of
+# distances computed by cdist, to bound memory use.
+_CDIST_BLOCK_SIZE = 2**22
+
+# minimum number of elements in the block of distances computed by each
+# thread; smaller problems aren't worth the cost of a thread pool.
+_CDIST_MIN_THREAD_BLOCK_SIZE = 2**16
+
 
 class MolecularClusterMixin:
     """Additional logic for clusterers in enspara that cluster molecular
@@ -57,7 +74,8 @@ class MolecularClusterMixin:
         pred_assigs, pred_dists = assign_to_nearest_center(
             trajectory=X,
             cluster_centers=self.centers_,
-            distance_method=self.metric)
+            distance_method=self.metric,
+            n_procs=getattr(self, 'n_procs', None))
         pred_centers = find_cluster_centers(pred_assigs, pred_dists)
 
         result = ClusterResult(
@@ -139,7 +157,8 @@ class ClusterResult(namedtuple('ClusterResult',
                 centers=self.centers)
 
 
-def assign_to_nearest_center(trajectory, cluster_centers, distance_method):
+def assign_to_nearest_center(
+        trajectory, cluster_centers, distance_method, n_procs=None):
     """Assign each frame from trajectory to one of the given cluster centers
     using the given distance metric.
 
@@ -155,6 +174,9 @@ def assign_to_nearest_center(trajectory, cluster_centers, distance_method):
         The distance method to use for assigning each observation in
         trajectorys to one of the cluster_centers. Must take the entire
         trajectory and one item from cluster_centers as parameters.
+    n_procs : int, default=None
+        Number of threads to use when assigning feature data to many
+        centers at once. If None, this is determined automatically.
 
     Returns
     ----------
@@ -166,6 +188,12 @@ def assign_to_nearest_center(trajectory, cluster_centers, distance_method):
         frame in cluster_centers.
     """
 
+    cdist_metric = _CDIST_METRICS.get(distance_method)
+    if (cdist_metric is not None and not hasattr(trajectory, 'xyz') and
+            len(cluster_centers) > 0):
+        return _assign_to_nearest_center_cdist(
+            trajectory, cluster_centers, cdist_metric, n_procs=n_procs)
+
     assignments = np.zeros(len(trajectory), dtype=int)
     distances = np.empty(len(trajectory), dtype=float)
     distances.fill(np.inf)
@@ -177,13 +205,112 @@ def assign_to_nearest_center(trajectory, cluster_centers, distance_method):
         for i, frame in enumerate(trajectory):
             dist = distance_method(cluster_centers, frame)
             assignments[i] = np.argmin(dist)
-            distances[i] = np.min(dist)
+            distances[i] = dist[assignments[i]]
     else:
+        # reuse one mask across centers rather than allocating a new one
+        # for each comparison.
+        closer = np.empty(len(trajectory), dtype=bool)
         for i, center in enumerate(cluster_centers):
             dist = distance_method(trajectory, center)
-            inds = (dist < distances)
-            distances[inds] = dist[inds]
-            assignments[inds] = i
+            np.less(dist, distances, out=closer)
+            np.copyto(distances, dist, where=closer)
+            np.copyto(assignments, i, where=closer)
+
+    return assignments, distances
+
+
+def _assign_to_nearest_center_cdist(
+        trajectory, cluster_centers, metric, n_procs=None):
+    """Assign each observation in a feature array to its nearest center
+    by computing distances to all centers at once, rather than calling a
+    distance function once per center.
+
+    Distances are computed in blocks of frames so that the intermediate
+    (n_frames, n_centers) distance matrix stays small. Euclidean
+    distances are found with sklearn's euclidean_distances, which
+    expands ||x - c||^2 into ||x||^2 - 2 x.c + ||c||^2 so that the bulk
+    of the work is a single BLAS matrix product; other metrics use
+    scipy's cdist. Because the expanded form is inexact, frames whose
+    nearest centers can't be told apart within its error are reassigned
+    using exact distances.
+    """
+
+    centers = np.asarray(cluster_centers)
+
+    if metric == 'euclidean':
+        center_sq_norms = np.einsum(
+            'ij,ij->i', centers, centers, dtype=np.float64)
+
+    assignments = np.zeros(len(trajectory), dtype=int)
+    distances = np.empty(len(trajectory), dtype=float)
+
+    def assign_block(block):
+        X = trajectory[block]
+        if metric == 'euclidean':
+            # older sklearn only accepts norms shaped (1, n_centers)
+            dists = euclidean_distances(
+                X, centers, Y_norm_squared=center_sq_norms[np.newaxis, :],
+                squared=True)
+        else:
+            dists = cdist(X, centers, metric=metric)
+
+        # argmin takes the first minimum, so ties go to the lowest center
+        # index, just as in the one-center-at-a-time loop.
+        assigs = np.argmin(dists, axis=1)
+
+        if metric == 'euclidean':
+            # the expanded form loses precision to cancellation, up to
+            # about n_features * eps * (||x||^2 + ||c||^2). Any center
+            # within twice that of the best could really be the nearest,
+            # so frames with more than one such center are reassigned
+            # with exact distances.
+            X_sq_norms = np.einsum('ij,ij->i', X, X, dtype=np.float64)
+            tol = (4 * (X.shape[1] + 2) * np.finfo(dists.dtype).eps *
+                   (X_sq_norms + center_sq_norms.max()))
+            best = dists[np.arange(len(dists)), assigs]
+            ambiguous = np.count_nonzero(
+                dists <= (best + 2 * tol)[:, None], axis=1) > 1
+            if np.any(ambiguous):
+                assigs[ambiguous] = np.argmin(
+                    cdist(X[ambiguous], centers, metric=metric), axis=1)
+
+            # likewise, take the distance to the chosen center directly,
+            # in double precision (as libdist does), so that integer
+            # features can't overflow in the subtraction.
+            diff = np.subtract(X, centers[assigs], dtype=np.float64)
+            distances[block] = np.sqrt(
+                np.einsum('ij,ij->i', diff, diff, dtype=np.float64))
+        else:
+            distances[block] = dists[np.arange(len(dists)), assigs]
+
+        assignments[block] = assigs
+
+    block_len = max(1, _CDIST_BLOCK_SIZE // len(centers))
+
+    # the matrix product behind euclidean_distances is already threaded
+    # by BLAS, but cdist is not. cdist releases the GIL, though, so other
+    # metrics are split into at least one block per thread and the
+    # blocks (which write to disjoint slices) are run concurrently, as
+    # long as each thread gets a worthwhile amount of work.
+    if metric == 'euclidean':
+        n_threads = 1
+    else:
+        n_threads = auto_nprocs() if n_procs is None else n_procs
+        n_threads = min(n_threads, len(trajectory) * len(centers) //
+                        _CDIST_MIN_THREAD_BLOCK_SIZE)
+    if n_threads > 1:
+        block_len = max(1, min(block_len, -(-len(trajectory) // n_threads)))
+
+    blocks = [slice(start, start + block_len)
+              for start in range(0, len(trajectory), block_len)]
+
+    if n_threads > 1 and len(blocks) > 1:
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            # list() re-raises any exception raised in a worker
+            list(executor.map(assign_block, blocks))
+    else:
+        for block in blocks:
+            assign_block(block)
 
     return assignments, distances
 
@@ -213,14 +340,20 @@ def find_cluster_centers(assignments, distances):
             "Length of distances (%s) must match length of assignments "
             "(%s)." % (len(distances), len(assignments)))
 
-    unique_centers = np.unique(assignments)
-    center_inds = np.zeros_like(unique_centers)
+    assignments = np.asarray(assignments)
+    distances = np.asarray(distances)
 
-    for i, c in enumerate(unique_centers):
-        assigned_frames = np.where(assignments == c)[0]
-        ind = assigned_frames[np.argmin(distances[assigned_frames])]
+    # sort frames by assignment, then distance, in one pass instead of
+    # scanning all frames for each label. lexsort is stable, so ties in
+    # distance go to the earliest frame, as argmin would.
+    order = np.lexsort((distances, assignments))
+    sorted_assigs = assignments[order]
+    first_of_label = np.ones(len(sorted_assigs), dtype=bool)
+    first_of_label[1:] = sorted_assigs[1:] != sorted_assigs[:-1]
 
-        center_inds[i] = ind
+    unique_centers = sorted_assigs[first_of_label]
+    center_inds = np.zeros_like(unique_centers)
+    center_inds[:] = order[first_of_label]
 
     return center_inds
 
@@ -84,13 +84,15 @@ def _hamming(np.ndarray[INTEGRAL_TYPE_T, ndim=2] X,
     assert n_features == X.shape[1], "Number of features between X and y didn't match."
 
     cdef long i, j = 0
+    cdef long n_diff
 
+    # count mismatches in a thread-private local (see _euclidean).
     for i in prange(n_samples, nogil=True):
-        out[i] = 0
+        n_diff = 0
         for j in range(n_features):
             if y[j] != X[i, j]:
-                out[i] += 1
-        out[i] /= n_features
+                n_diff = n_diff + 1
+        out[i] = <double>n_diff / n_features
 
     return out
 
@@ -107,12 +109,17 @@ def _manhattan(np.ndarray[FLOAT_TYPE_T, ndim=2] X,
     assert n_features == X.shape[1]
 
     cdef long i, j = 0
-    for i in prange(n_samples, nogil=True):
-        out[i] = 0
+    cdef double diff, acc
 
+    # subtract, take the absolute value and sum in a single pass over
+    # each sample, accumulating in a thread-private local (see
+    # _euclidean).
     for i in prange(n_samples, nogil=True):
+        acc = 0
         for j in range(n_features):
-            out[i] += fabs(X[i, j] - y[j])
+            diff = X[i, j] - y[j]
+            acc = acc + fabs(diff)
+        out[i] = acc
 
     return out.reshape(-1, 1)
 
@@ -129,18 +136,19 @@ def _euclidean(np.ndarray[FLOAT_TYPE_T, ndim=2] X,
     assert n_features == X.shape[1]
 
     cdef long i, j = 0
+    cdef double diff, acc
 
-    # zero out output array; this is fast compared to the actual
-    # computation, so we always do it.
-    for i in prange(n_samples, nogil=True):
-        out[i] = 0
-
+    # subtract, square, sum and root each sample in a single pass,
+    # accumulating in a thread-private local rather than in `out`. This
+    # touches `out` once per sample, and lets the compiler vectorize the
+    # inner loop. (acc = acc + ..., rather than +=, keeps Cython from
+    # treating acc as a prange reduction variable.)
     for i in prange(n_samples, nogil=True):
+        acc = 0
         for j in range(n_features):
-            out[i] += (X[i, j] - y[j])**2
-
-    for i in prange(n_samples, nogil=True):
-        out[i] = sqrt(out[i])
+            diff = X[i, j] - y[j]
+            acc = acc + diff * diff
+        out[i] = sqrt(acc)
 
     return out.reshape(-1, 1)
 
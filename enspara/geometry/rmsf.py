@@ -3,7 +3,9 @@ import numpy as np
 import mdtraj as md
 
 
-def rmsf_calc(centers, populations=None, ref_frame=0, per_residue=True):
+def rmsf_calc(
+        centers, populations=None, ref_frame=0, per_residue=True,
+        atom_indices=None):
     """Calculated the population weighted RMSF from a frame in a MSM
 
     Attributes
@@ -19,6 +21,11 @@ def rmsf_calc(centers, populations=None, ref_frame=0, per_residue=True):
     per_residue : bool, default=True,
         Optionally returns rmsf averaged over residues. If False, will
         return the rmsf per atom.
+    atom_indices : array-like, default=None,
+        Indices of the atoms to align states to the reference frame
+        on (e.g. the backbone). Aligning on a subset skips the other
+        atoms in the superposition, but RMSFs are still reported for
+        every atom. If not supplied, all atoms are used.
 
     Returns
     ----------
@@ -26,7 +33,8 @@ def rmsf_calc(centers, populations=None, ref_frame=0, per_residue=True):
         Returns the population weighted RMSF of each residue.
     """
     # align all states to reference frame
-    centers = centers.superpose(centers[ref_frame])
+    centers = centers.superpose(
+        centers[ref_frame], atom_indices=atom_indices)
 
     # if no populations are supplied, generate a uniform distribution
     if populations is None:
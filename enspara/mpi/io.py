@@ -1,9 +1,12 @@
 import logging
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import tables
 
 from ..util.load import load_as_concatenated
+from ..util.parallel import auto_nprocs
 from .. import exception, ra
 
 from .. import mpi
@@ -39,10 +42,12 @@ def load_h5_as_striped(filename, stride=1):
     """
 
     if mpi.rank() == 0:
+        # list_nodes reads only node metadata, so names and shapes can
+        # both be taken from it without looking each node up again.
         with tables.open_file(filename) as handle:
-            all_keys = [k.name for k in handle.list_nodes('/')]
-            all_shapes = [handle.get_node(where='/', name=k).shape
-                          for k in all_keys]
+            nodes = handle.list_nodes('/')
+            all_keys = [n.name for n in nodes]
+            all_shapes = [n.shape for n in nodes]
 
     if mpi.size() >= 1:
         all_keys = mpi.comm.bcast(all_keys if mpi.rank() == 0 else None,
@@ -70,7 +75,7 @@ def load_h5_as_striped(filename, stride=1):
     return global_lengths, local_data
 
 
-def load_npy_as_striped(filenames, stride=1):
+def load_npy_as_striped(filenames, stride=1, dtype=None):
     """Load ndarrays into distributed arrays across nodes in an MPI swarm.
 
     File i is loaded by node i % n, where n is the number of nodes in
@@ -84,6 +89,10 @@ def load_npy_as_striped(filenames, stride=1):
         supports are supported by this function.
     stride : int, default=1
         Load only every stride-th frame.
+    dtype : np.dtype, default=None
+        Type of the returned array. Each file is converted as it is
+        copied in, so no full-size intermediate is allocated. By
+        default, the type of the files is kept.
 
     Returns
     -------
@@ -99,38 +108,46 @@ def load_npy_as_striped(filenames, stride=1):
     specs = [(h.shape, h.dtype) for h in
              (np.load(f, mmap_mode='r') for f in filenames)]
 
-    shape0, dtype = specs[0]
+    shape0, shape0_dtype = specs[0]
     for i, (s, d) in enumerate(specs):
         if s[1:] != shape0[1:]:
             raise exception.ImproperlyConfigured(
                 "Subsequent dimensions of file '{}' didn't match shape "
                 "of first file, '{}' ({} != {})".format(
                     filenames[0], filenames[i], shape0, s))
-        if d != dtype:
+        if d != shape0_dtype:
             raise exception.ImproperlyConfigured(
                 "Type of file '{}' didn't match type first file, '{}' "
                 "({} != {})".format(
-                    filenames[0], filenames[i], dtype, d))
+                    filenames[0], filenames[i], shape0_dtype, d))
 
     global_lengths = [s[0] for s, d in specs]
     logger.debug("Determined global lengths to be %s", global_lengths)
-    local_lengths = [s[0] for s, d in specs[mpi.rank()::mpi.size()]]
+    local_lengths = [(s[0] + stride - 1) // stride
+                     for s, d in specs[mpi.rank()::mpi.size()]]
+    offsets = np.concatenate([[0], np.cumsum(local_lengths)])
 
-    local_data = np.empty((sum(local_lengths),) + shape0[1:],
-                          dtype=dtype)
+    if dtype is None:
+        dtype = shape0_dtype
+    local_data = np.empty((offsets[-1],) + shape0[1:], dtype=dtype)
     logger.debug("Allocated array of shape %s and type %s",
                  local_data.shape, local_data.dtype)
 
-    # TODO could be thread parallelized?
     local_filenames = filenames[mpi.rank()::mpi.size()]
-    start = 0
-    for i, f in enumerate(local_filenames):
-        data = np.load(f, mmap_mode='r')
-        end = start + len(data[::stride])
+
+    def fill(i):
+        start, end = offsets[i], offsets[i+1]
         logger.debug("Writing file %s to [%s:%s]", i, start, end)
+        data = np.load(local_filenames[i], mmap_mode='r')
         local_data[start:end] = data[::stride]
-        start = end
-    assert end == len(local_data)
+
+    # each file is copied into its own (precomputed) slice of local_data,
+    # and numpy releases the GIL while copying out of the memory map, so
+    # reading files in threads overlaps their disk I/O.
+    n_threads = max(1, min(len(local_filenames), auto_nprocs()))
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        # list() re-raises any exception raised while loading a file
+        list(executor.map(fill, range(len(local_filenames))))
 
     logger.debug("Loaded %s npys into an array of shape %s.",
                  len(filenames), local_data.shape)
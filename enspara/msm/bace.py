@@ -15,6 +15,45 @@ from enspara import exception
 
 logger = logging.getLogger(__name__)
 
+# arrays shared with pool workers. When workers are forked, they inherit
+# these from the parent's memory rather than unpickling a copy per task.
+_shared = {}
+
+
+def _init_shared(shared):
+    global _shared
+    _shared = shared
+
+
+def _call_with_shared(func, indices):
+    return func(indices, **_shared)
+
+
+def _start_method():
+    # unlike get_start_method(), this doesn't fix the start method if it
+    # hasn't been set yet. The first method listed is the default.
+    return (multiprocessing.get_start_method(allow_none=True) or
+            multiprocessing.get_all_start_methods()[0])
+
+
+def _pool_map(n_procs, func, chunks, **shared):
+    """Map func(chunk, **shared) over chunks in a pool of n_procs.
+
+    If workers are forked, `shared` is handed to them through the pool
+    initializer and inherited without being serialized. Otherwise (e.g.
+    spawn, the default on macOS and Windows), it would be pickled either
+    way, so it is just bound to each task.
+    """
+    if _start_method() == 'fork':
+        with multiprocessing.Pool(
+                processes=n_procs, initializer=_init_shared,
+                initargs=(shared,)) as pool:
+            return pool.map(
+                functools.partial(_call_with_shared, func), chunks)
+    else:
+        with multiprocessing.Pool(processes=n_procs) as pool:
+            return pool.map(functools.partial(func, **shared), chunks)
+
 
 def getInds(c, stateInds, chunkSize, updateSingleState=None):
     indices = []
@@ -179,13 +218,13 @@ def calcDMat(c, w, bayes_factors, indices, dMat, n_procs, statesKeep,
         dlims = zip(range(0, end_index, step),
                     list(range(step, end_index, step)) + [n])
 
-        with multiprocessing.Pool(processes=n_procs) as pool:
-            result = pool.map(
-                functools.partial(multiDist, c=c, w=w, statesKeep=statesKeep,
-                                  unmerged=unmerged, chunkSize=chunkSize),
-                [indices[start:stop] for start, stop in dlims])
+        result = _pool_map(
+            n_procs, multiDist,
+            [indices[start:stop] for start, stop in dlims],
+            c=c, w=w, statesKeep=statesKeep, unmerged=unmerged,
+            chunkSize=chunkSize)
 
-            d = np.vstack(result)
+        d = np.vstack(result)
     else:
         d = multiDist(indices, c, w, statesKeep, unmerged, chunkSize)
     for i in range(len(indices)):
@@ -358,13 +397,13 @@ def baysean_prune(c, n_procs=1, factor=np.log(3)):
         dlims = zip(range(0, end_index, step),
                     list(range(step, end_index, step)) + [n_ind])
 
-        with multiprocessing.Pool(processes=n_procs) as pool:
-            result = pool.map(
-                functools.partial(multiDistHelper, c1=pseud, w1=1, c=c, w=w,
-                                  statesKeep=statesKeep, unmerged=unmerged),
-                [indices[start:stop] for start, stop in dlims])
+        result = _pool_map(
+            n_procs, multiDistHelper,
+            [indices[start:stop] for start, stop in dlims],
+            c1=pseud, w1=1, c=c, w=w, statesKeep=statesKeep,
+            unmerged=unmerged)
 
-            d = np.concatenate(result)
+        d = np.concatenate(result)
     else:
         d = multiDistHelper(indices, pseud, 1, c, w, statesKeep, unmerged)
 
@@ -33,8 +33,8 @@ def bootstrap(func, data, n_trials, n_procs=1, **kwargs):
     shared_data_shape = data.shape
     # generate random sample indices
     rand_sampling_iis = [
-        np.random.choice(np.arange(data.shape[0]), data.shape[0])
-        for i in np.arange(n_trials)]
+        np.random.choice(data.shape[0], data.shape[0])
+        for _ in range(n_trials)]
     strap_data = list(
         zip(
             itertools.repeat(func), rand_sampling_iis,
@@ -11,6 +11,8 @@ import numpy as np
 import scipy
 import scipy.sparse
 
+from .. import exception
+
 
 def synthetic_trajectory(T, start_state, n_steps):
     """Simulate a single trajectory using kinetic Monte Carlo.
@@ -18,7 +20,8 @@ def synthetic_trajectory(T, start_state, n_steps):
     Parameters
     ----------
     T : array, shape=(n_states, n_states)
-        A row-normalized transition probability matrix.
+        A row-normalized transition probability matrix. Every row must
+        have a positive sum.
     start_state : int
         State to start the trajectory from.
     n_steps : int
@@ -35,14 +38,53 @@ def synthetic_trajectory(T, start_state, n_steps):
     traj[0] = start_state
     states = T.shape[0]
     rng = np.random.default_rng()
-    if scipy.sparse.isspmatrix(T):
-        for i in range(n_steps-1):
-            p = T[traj[i], :].toarray()[0]
-            traj[i + 1] = rng.choice(states, 1, p=p)
+
+    # sample by inverse CDF: build every row's cumulative distribution
+    # once (normalized, so each ends at exactly 1) and draw all the
+    # uniform variates up front, so each step is a binary search rather
+    # than a call to rng.choice. side='right' means states with zero
+    # probability (flat steps in the CDF) are never chosen.
+    u = rng.random(n_steps - 1)
+    if scipy.sparse.issparse(T):
+        # the same, but over only the stored entries of each CSR row, so
+        # no row is ever densified.
+        T = scipy.sparse.csr_matrix(T, dtype=float)
+        T.sum_duplicates()
+        T.eliminate_zeros()
+        indptr, indices = T.indptr, T.indices
+
+        # empty rows would otherwise index into the next row's entries.
+        row_totals = np.asarray(T.sum(axis=1)).flatten()
+        bad_rows = np.where(~(row_totals > 0))[0]
+        if len(bad_rows) > 0:
+            raise exception.DataInvalid(
+                "Transition matrix rows must have positive sums, but "
+                "row(s) %s do not." % bad_rows)
+
+        # each row's CDF is accumulated separately (a single cumsum over
+        # all of T.data would lose the precision of late rows to
+        # rounding), and only when the walk first visits that row, so
+        # short walks on large MSMs don't pay for every row.
+        row_cdfs = {}
+        for i in range(n_steps - 1):
+            row = traj[i]
+            if row not in row_cdfs:
+                start, end = indptr[row], indptr[row+1]
+                row_cum = np.cumsum(T.data[start:end])
+                row_cdfs[row] = (row_cum / row_cum[-1], indices[start:end])
+            row_cum, row_indices = row_cdfs[row]
+            k = np.searchsorted(row_cum, u[i], side='right')
+            traj[i+1] = row_indices[k]
     else:
+        T_cum = np.cumsum(np.asarray(T, dtype=float), axis=1)
+        bad_rows = np.where(~(T_cum[:, -1] > 0))[0]
+        if len(bad_rows) > 0:
+            raise exception.DataInvalid(
+                "Transition matrix rows must have positive sums, but "
+                "row(s) %s do not." % bad_rows)
+        T_cum /= T_cum[:, -1:]
         for i in range(n_steps - 1):
-            p = T[traj[i], :]
-            traj[i+1] = rng.choice(states, 1, p=p)
+            traj[i+1] = np.searchsorted(T_cum[traj[i]], u[i], side='right')
     return traj
 
 
@@ -52,10 +94,10 @@ def synthetic_ensemble(T, init_pops, n_steps, observable_per_state=None):
     The time that elapses for each step is the lag time of the input transition
     probability matrix.
 
-    If observable_per_state is specified, this is a 1-D array containing the
-    population-weighted average observable as a function of time. Otherwise,
-    this is a 2-D array where each row contains the populations of each state
-    as a function of time.
+    If observable_per_state is specified, this is an array containing the
+    population-weighted average observable(s) as a function of time.
+    Otherwise, this is a 2-D array where each row contains the populations of
+    each state as a function of time.
 
     Parameters
     ----------
@@ -67,37 +109,45 @@ def synthetic_ensemble(T, init_pops, n_steps, observable_per_state=None):
         Number of steps to advance the ensemble. This includes the starting
         populations, so n_steps=2 would result in a trajectory consisting of
         the starting state and one step forward in time.
-    observable_per_state : array, shape=(n_states, ), default=None
+    observable_per_state : array, shape=(n_states, ...), default=None
         An array of floats representing some observable for each state.
+        Several observables can be given as columns of a 2-D array, in
+        which case all of them are averaged over the same (single)
+        propagation of the ensemble.
 
     Returns
     -------
     out : array, shape=(n_steps, ...)
         An array representing the time evolution of an ensemble. If
-        observable_per_state is specified, this is a 1-D array containing the
-        population-weighted average observable as a function of time.
+        observable_per_state is specified, this is an array of shape
+        (n_steps, ) + observable_per_state.shape[1:] containing the
+        population-weighted average observable(s) as a function of time.
         Otherwise, this is a 2-D array where each row contains the populations
         of each state as a function of time.
     """
 
-    # turn transitions probability matrix into linear operator
+    # populations evolve as p <- T^T p. Transpose T once here so each
+    # step is a single matrix-vector product on a contiguous operator.
     if scipy.sparse.issparse(T):
-        T_op = scipy.sparse.linalg.aslinearoperator(T.tocsr())
+        T_t = T.T.tocsr()
     else:
-        T_op = scipy.sparse.linalg.aslinearoperator(T)
+        T_t = np.ascontiguousarray(np.asarray(T).T)
 
-    p = init_pops.copy()
+    p = np.array(init_pops, dtype=float)
     if observable_per_state is not None:
-        observations = [p.dot(observable_per_state)]
-        for i in range(n_steps-1):
-            p = T_op.rmatvec(p)
-            observations.append(p.dot(observable_per_state))
+        observable_per_state = np.asarray(observable_per_state)
+        observations = np.empty(
+            (n_steps,) + observable_per_state.shape[1:],
+            dtype=np.result_type(p, observable_per_state))
+        observations[0] = p.dot(observable_per_state)
+        for i in range(1, n_steps):
+            p = T_t.dot(p)
+            observations[i] = p.dot(observable_per_state)
     else:
-        observations = [p]
-        for i in range(n_steps-1):
-            p = T_op.rmatvec(p)
-            observations.append(p)
-
-    observations = np.array(observations)
+        observations = np.empty((n_steps, len(p)), dtype=p.dtype)
+        observations[0] = p
+        for i in range(1, n_steps):
+            p = T_t.dot(p)
+            observations[i] = p
 
     return p, observations
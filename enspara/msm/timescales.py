@@ -1,4 +1,7 @@
 import logging
+import multiprocessing as mp
+
+from functools import partial
 
 import numpy as np
 
@@ -42,7 +45,7 @@ def calc_imp_times(assigns, lag_time, n_states, n_times, method,
 
 def implied_timescales(
         assigns, lag_times, method, n_times=None,
-        sliding_window=True, trim=False):
+        sliding_window=True, trim=False, n_procs=1):
     """Calculate the implied timescales across a range of lag times.
 
     Parameters
@@ -67,6 +70,9 @@ def implied_timescales(
     sliding_window : bool, default=True
         Whether to use a sliding window for counting transitions or to
         take every lag_time'th state.
+    n_procs : int, default=1
+        The number of processes across which to spread the lag times.
+        Each lag time's eigenspectrum is independent of the others.
 
     Returns
     -------
@@ -83,11 +89,14 @@ def implied_timescales(
     if n_times > n_states - 1:  # -1 accounts for eq pops
         n_times = n_states - 1
 
-    implied_times_list = []
-    for t in lag_times:
-        tscale = calc_imp_times(assigns, t, n_states, n_times,
-                                method, sliding_window, trim)
+    calc = partial(calc_imp_times, assigns, n_states=n_states,
+                   n_times=n_times, method=method,
+                   sliding_window=sliding_window, trim=trim)
 
-        implied_times_list.append(tscale)
+    if n_procs is not None and n_procs > 1 and len(lag_times) > 1:
+        with mp.Pool(processes=min(n_procs, len(lag_times))) as p:
+            implied_times_list = p.map(calc, lag_times)
+    else:
+        implied_times_list = [calc(t) for t in lag_times]
 
     return np.array(implied_times_list)
@@ -8,7 +8,8 @@ from datetime import datetime
 from nose.tools import assert_equal, assert_raises
 
 import numpy as np
-from numpy.testing import assert_array_equal
+import mdtraj as md
+from numpy.testing import assert_array_equal, assert_allclose
 
 from sklearn.datasets import make_blobs
 
@@ -104,6 +105,50 @@ def test_rmsd_cluster_basic():
         expected_size=expected_size)
 
 
+def test_rmsd_cluster_radius_distances():
+
+    # every frame's reported distance should be its true RMSD to its
+    # assigned center. (If clustering uses wrong RMSDs, radius-based
+    # clustering may never terminate.)
+    selection = '(name N or name C or name CA or name H or name O)'
+    trj = md.load(TRJFILE, top=TOPFILE)
+    trj = trj.atom_slice(trj.top.select(selection))
+
+    for algorithm in ['kcenters', 'khybrid']:
+        td = tempfile.mkdtemp(dir=os.getcwd())
+        try:
+            cluster.main([
+                '',
+                '--trajectories', TRJFILE,
+                '--topology', TOPFILE,
+                '--cluster-radius', '0.1',
+                '--atoms', selection,
+                '--algorithm', algorithm,
+                '--distances', os.path.join(td, 'distances.h5'),
+                '--assignments', os.path.join(td, 'assignments.h5'),
+                '--center-features', os.path.join(td, 'centers.pkl'),
+                '--center-indices', os.path.join(td, 'center-inds.npy')])
+
+            distances = ra.load(os.path.join(td, 'distances.h5'))[0]
+            assignments = ra.load(os.path.join(td, 'assignments.h5'))[0]
+            center_inds = np.load(os.path.join(td, 'center-inds.npy'))
+        finally:
+            shutil.rmtree(td)
+
+        # k-medoids refinement may move centers such that some frames
+        # end up further away than the radius.
+        if algorithm == 'kcenters':
+            assert np.all(distances < 0.1)
+
+        expected = np.zeros(trj.n_frames)
+        for i, (_, center_frame) in enumerate(center_inds):
+            frames = np.where(assignments == i)[0]
+            expected[frames] = md.rmsd(trj[frames], trj, frame=center_frame)
+
+        # (mdtraj reports self-RMSDs as ~1e-4 rather than 0)
+        assert_allclose(distances, expected, atol=1e-3)
+
+
 def test_rmsd_cluster_basic_kcenters():
 
     expected_size = (2, 501)
@@ -362,6 +407,45 @@ def test_feature_cluster_manhattan():
         assert np.all(assignments[i] == assignments[iis])
 
 
+def test_feature_cluster_float32():
+
+    X, y = make_blobs(
+        n_samples=100, n_features=3, centers=3, center_box=(0, 100),
+        random_state=0)
+
+    td = tempfile.mkdtemp(dir=os.getcwd())
+    try:
+        featfile = os.path.join(td, 'features.h5')
+        ra.save(featfile, ra.RaggedArray(array=X, lengths=[50, 30, 20]))
+
+        centersfile = os.path.join(td, 'centers.npy')
+        cluster.main([
+            '',
+            '--features', featfile,
+            '--feature-dtype', 'float32',
+            '--cluster-number', '3',
+            '--algorithm', 'khybrid',
+            '--cluster-distance', 'euclidean',
+            '--distances', os.path.join(td, 'distances.h5'),
+            '--assignments', os.path.join(td, 'assignments.h5'),
+            '--center-features', centersfile])
+
+        assignments = ra.load(os.path.join(td, 'assignments.h5'))
+        centers = np.load(centersfile)
+    finally:
+        shutil.rmtree(td)
+
+    # centers are frames of the clustered features, so they show whether
+    # the features were actually converted.
+    assert_equal(centers.dtype, np.float32)
+    assert_equal(centers.shape, (3, 3))
+
+    y = reorder_assignments(y)
+    assignments = reorder_assignments(assignments.flatten())
+
+    assert_array_equal(y, assignments)
+
+
 def test_feature_cluster_radius_based_h5_input():
 
     expected_size = (3, (50, 30, 20))
@@ -6,6 +6,7 @@ from nose.tools import assert_is, assert_is_not
 from numpy.testing import assert_array_equal, assert_allclose
 
 from enspara.cluster import util
+from enspara.geometry import libdist
 from enspara.util import array as ra
 
 from ..cluster import save_states
@@ -124,6 +125,74 @@ def test_assign_to_nearest_center_many_centers():
     assert_array_equal(np.argmin(alldists, axis=0), assigns)
 
 
+def test_assign_to_nearest_center_features():
+
+    # euclidean and manhattan features are assigned with a batched
+    # cdist, which should agree with computing each center's distances.
+    rg = np.random.RandomState(seed=0)
+    X = rg.normal(size=(200, 5))
+    center_frames = [0, 50, 100, 150]
+
+    for metric in [libdist.euclidean, libdist.manhattan]:
+        assigns, distances = util.assign_to_nearest_center(
+            X, X[center_frames], metric)
+
+        alldists = np.zeros((len(center_frames), len(X)))
+        for i, center in enumerate(X[center_frames]):
+            alldists[i] = metric(X, center)
+
+        assert_allclose(np.min(alldists, axis=0), distances)
+        assert_array_equal(np.argmin(alldists, axis=0), assigns)
+
+
+def test_assign_to_nearest_center_features_precision():
+
+    # batched euclidean assignment uses an inexact expansion of the
+    # distance; it should still agree with the exact per-center loop for
+    # float32 features, and when features are far from the origin
+    # relative to their spread (where the expansion loses the most).
+    # Integer features must not overflow when differences are taken.
+    rg = np.random.RandomState(seed=0)
+    cases = [
+        rg.normal(size=(2000, 5)).astype(np.float32),
+        (1e2 + rg.normal(scale=1e-3, size=(2000, 5))).astype(np.float32),
+        1e3 + rg.normal(scale=1e-3, size=(2000, 5)),
+        1e4 + rg.normal(scale=1e-3, size=(2000, 5)),
+        rg.randint(-100, 100, size=(2000, 5)).astype(np.int8),
+        rg.randint(-30000, 30000, size=(2000, 5)).astype(np.int16),
+        np.array([[30000, 0], [-30000, 0]], dtype=np.int16),
+    ]
+
+    for X in cases:
+        centers = X[rg.choice(len(X), min(len(X), 50), replace=False)]
+        assigns, distances = util.assign_to_nearest_center(
+            X, centers, libdist.euclidean)
+
+        alldists = np.array([libdist.euclidean(X, c) for c in centers])
+
+        assert_array_equal(np.argmin(alldists, axis=0), assigns)
+        assert_allclose(np.min(alldists, axis=0), distances, rtol=1e-6)
+
+
+def test_assign_to_nearest_center_features_n_procs():
+
+    # threaded cdist assignment should give the same answer regardless
+    # of the number of threads, including for inputs too small to split.
+    rg = np.random.RandomState(seed=0)
+
+    for n_frames in [10, 20000]:
+        X = rg.normal(size=(n_frames, 3))
+        centers = X[:10]
+
+        serial = util.assign_to_nearest_center(
+            X, centers, libdist.manhattan, n_procs=1)
+        threaded = util.assign_to_nearest_center(
+            X, centers, libdist.manhattan, n_procs=4)
+
+        assert_array_equal(serial[0], threaded[0])
+        assert_array_equal(serial[1], threaded[1])
+
+
 def test_find_cluster_centers_ndarray():
 
     d = np.array([0.2, 0.1, 0.1, 0.2])
@@ -40,3 +40,26 @@ def test_parallel_h5_read_strided():
 
     assert_array_equal(local_arr,
                        full_arr[mpi.rank()::mpi.size(), ::3]._data)
+
+
+@attr('mpi')
+def test_parallel_npy_read_dtype():
+
+    arrs = [np.random.random(size=(random.randint(3, 17), 11))
+            for i in range(mpi.size() * 3)]
+
+    with tempfile.TemporaryDirectory() as d:
+        filenames = []
+        for i, arr in enumerate(arrs):
+            filenames.append('%s/%s.npy' % (d, i))
+            np.save(filenames[-1], arr)
+
+        global_lengths, local_arr = mpi.io.load_npy_as_striped(
+            filenames, stride=2, dtype=np.float32)
+
+    assert_array_equal(global_lengths, [len(a) for a in arrs])
+    assert local_arr.dtype == np.float32
+    assert_array_equal(
+        local_arr,
+        np.concatenate([a[::2] for a in arrs[mpi.rank()::mpi.size()]])
+        .astype(np.float32))
@@ -93,6 +93,19 @@ def test_implied_timescales():
     assert_equal(tscales.shape, (4, 3))
 
 
+def test_implied_timescales_parallel():
+
+    in_assigns = TRIMMABLE['assigns']
+
+    serial = implied_timescales(
+        in_assigns, lag_times=range(1, 5), method=builders.transpose)
+    parallel = implied_timescales(
+        in_assigns, lag_times=range(1, 5), method=builders.transpose,
+        n_procs=2)
+
+    assert_allclose(serial, parallel)
+
+
 def test_eigenspectrum_types():
 
     expected_vals = np.array([1., 0.56457513, 0.03542487])
@@ -0,0 +1,75 @@
+import numpy as np
+import mdtraj as md
+
+from numpy.testing import assert_allclose, assert_array_equal
+
+from ..geometry.rmsf import rmsf_calc
+
+
+def _rigid_and_floppy_traj(n_frames=10, seed=0):
+    """Two three-atom residues; the first is rigid and the second is
+    shifted relative to it by a different amount in each frame. Each
+    frame is then randomly rotated and translated as a whole."""
+
+    rg = np.random.RandomState(seed=seed)
+
+    top = md.Topology()
+    chain = top.add_chain()
+    for name in ['ALA', 'GLY']:
+        residue = top.add_residue(name, chain)
+        for atom_name in ['N', 'CA', 'C']:
+            top.add_atom(atom_name, md.element.carbon, residue)
+
+    body = np.array([[0.0, 0.0, 0.0],
+                     [0.3, 0.0, 0.0],
+                     [0.0, 0.4, 0.0],
+                     [1.0, 1.0, 0.0],
+                     [1.3, 1.0, 0.0],
+                     [1.0, 1.4, 0.0]])
+
+    shifts = rg.normal(scale=0.2, size=(n_frames, 3))
+    shifts[0] = 0
+
+    xyz = np.zeros((n_frames, 6, 3))
+    for i in range(n_frames):
+        frame = body.copy()
+        frame[3:] += shifts[i]
+        rot, _ = np.linalg.qr(rg.normal(size=(3, 3)))
+        xyz[i] = frame.dot(rot) + rg.normal(size=3)
+
+    return md.Trajectory(xyz, top), shifts
+
+
+def test_rmsf_default_atom_indices():
+
+    trj, _ = _rigid_and_floppy_traj()
+
+    for per_residue in [True, False]:
+        # superpose aligns in place, so each call gets its own copy
+        assert_allclose(
+            rmsf_calc(trj[:], per_residue=per_residue),
+            rmsf_calc(trj[:], per_residue=per_residue, atom_indices=None))
+
+
+def test_rmsf_atom_indices_subset():
+
+    trj, shifts = _rigid_and_floppy_traj()
+    rigid = np.arange(3)
+
+    # aligning on the rigid residue leaves it still, and everything else
+    # moves by exactly the shifts put into it.
+    per_atom = rmsf_calc(trj[:], per_residue=False, atom_indices=rigid)
+    assert_array_equal(per_atom.shape, (trj.n_atoms,))
+
+    expected = np.sqrt(np.mean(np.sum(shifts**2, axis=1)))
+    assert_allclose(per_atom[:3], 0, atol=1e-5)
+    assert_allclose(per_atom[3:], expected, rtol=1e-4)
+
+    per_resi = rmsf_calc(trj[:], per_residue=True, atom_indices=rigid)
+    assert_array_equal(per_resi.shape, (trj.n_residues,))
+    assert_allclose(per_resi, [0, expected], atol=1e-5, rtol=1e-4)
+
+    # aligning on every atom spreads the motion over the rigid residue
+    all_atom = rmsf_calc(trj[:], per_residue=False)
+    assert np.all(all_atom[:3] > 1e-3)
+    assert not np.allclose(all_atom, per_atom, atol=1e-3)
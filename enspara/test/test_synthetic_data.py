@@ -0,0 +1,83 @@
+import numpy as np
+import scipy.sparse
+from numpy.testing import assert_allclose, assert_array_equal
+
+from nose.tools import assert_raises
+
+from .. import exception
+from ..msm.synthetic_data import synthetic_ensemble, synthetic_trajectory
+
+T = np.array([[0.5, 0.5, 0.0],
+              [0.1, 0.6, 0.3],
+              [0.0, 0.2, 0.8]])
+
+
+def test_synthetic_ensemble_matches_matrix_power():
+
+    init_pops = np.array([0.2, 0.3, 0.5])
+    n_steps = 6
+
+    expected_pops = np.array(
+        [init_pops.dot(np.linalg.matrix_power(T, i))
+         for i in range(n_steps)])
+
+    obs_1d = np.array([1.0, -2.0, 3.5])
+    obs_2d = np.array([[1.0, 0.0],
+                       [-2.0, 1.0],
+                       [3.5, 2.0]])
+
+    for array_type in [np.array, scipy.sparse.csr_matrix]:
+        p, pops = synthetic_ensemble(array_type(T), init_pops, n_steps)
+        assert_allclose(pops, expected_pops)
+        assert_allclose(p, expected_pops[-1])
+
+        _, obs = synthetic_ensemble(
+            array_type(T), init_pops, n_steps, observable_per_state=obs_1d)
+        assert obs.shape == (n_steps,)
+        assert_allclose(obs, expected_pops.dot(obs_1d))
+
+        _, obs = synthetic_ensemble(
+            array_type(T), init_pops, n_steps, observable_per_state=obs_2d)
+        assert obs.shape == (n_steps, 2)
+        assert_allclose(obs, expected_pops.dot(obs_2d))
+
+
+def test_synthetic_trajectory_transition_frequencies():
+
+    n_steps = 200000
+
+    for array_type in [np.array, scipy.sparse.csr_matrix]:
+        traj = synthetic_trajectory(array_type(T), 0, n_steps)
+
+        assert traj.shape == (n_steps,)
+        assert traj[0] == 0
+
+        counts = np.zeros_like(T)
+        np.add.at(counts, (traj[:-1], traj[1:]), 1)
+
+        # transitions with zero probability must never be taken
+        assert_array_equal(counts[T == 0], 0)
+        assert_allclose(counts / counts.sum(axis=1, keepdims=True), T,
+                        atol=0.01)
+
+
+def test_synthetic_trajectory_zero_row():
+
+    T_bad = np.array([[0.5, 0.5, 0.0],
+                      [0.0, 0.0, 0.0],
+                      [0.0, 0.3, 0.7]])
+
+    for array_type in [np.array, scipy.sparse.csr_matrix]:
+        with assert_raises(exception.DataInvalid):
+            synthetic_trajectory(array_type(T_bad), 0, 10)
+
+    # explicitly stored zeros leave the row empty once eliminated
+    T_bad_sparse = scipy.sparse.csr_matrix(
+        (np.array([0.5, 0.5, 0.0, 0.3, 0.7]),
+         np.array([0, 1, 1, 1, 2]),
+         np.array([0, 2, 3, 5])),
+        shape=(3, 3))
+    assert T_bad_sparse.nnz == 5
+
+    with assert_raises(exception.DataInvalid):
+        synthetic_trajectory(T_bad_sparse, 0, 10)